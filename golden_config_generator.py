@@ -10,22 +10,50 @@ __docformat__ = 'reStructuredText'
 
 import argparse
 import csv
-import fileinput
-import json
-import os
+import locale
+import mmap
+import pathlib
+import re
 import signal
+import sys
 import time
-import logging
+from collections import defaultdict
 from datetime import datetime
-
-
-try:
-    """Try to import non-standard libraries, send a list of missing libraries if any aren't installed."""
-    from jinja2 import Environment, FileSystemLoader
-    from termcolor import cprint
-
-except ImportError as ie:
-    mod_list = ['jinja2 import Environment, FileSystemLoader', 'from termcolor import cprint']
+from functools import cache, cached_property
+
+
+# The project is the folder this program is in, its templates are in the Templates folder
+_PROJECT_PATH = pathlib.Path(__file__).resolve().parent
+_TEMPLATE_PATH = _PROJECT_PATH / 'Templates'
+# New switch templates are written here, outside of the project templates
+_NEW_TEMPLATE_PATH = _TEMPLATE_PATH / 'New_Templates'
+# The old configuration is read as bytes, decode it as open() in text mode would have, cp1252 on Windows
+_CONFIG_ENCODING = locale.getpreferredencoding(False)
+# Site names for the two letter site prefix of a hostname
+_SITE_PREFIXES = {'S1': 'site_1', 'S2': 'site_2', 'S3': 'Site_3'}
+# The line of stars that separates the sections of the hostname and base configuration files
+_SEP = '*' * 79
+# Switch type prefixes from the hostname that mean an access layer switch
+_ACCESS_PREFIXES = frozenset(('AS', 'SE', 'EN'))
+# The hostname argument, a configuration only has the one hostname line
+_HOSTNAME_RE = re.compile(rb'^hostname +(\S+)', re.M)
+# One pass over the configuration for everything but the hostname.  Group 1 is the header keyword of a VLAN,
+# interface or router block, matched up to its closing ! line.  Group 2 is the keyword of a kept single line
+# command, matched with its line ending.  The command keywords are grouped on their shared ``ip`` prefix so a line
+# start is only walked once before the command is known.
+_CONFIG_RE = re.compile(rb'^(?:(interface |router |vlan )(?s:.*?)(?=^!|\Z)'
+                        rb'|(spanning-tree vlan|logging|system mtu'
+                        rb'|ip (?:route|tacacs source-interface|pim rp-address|default-gateway))[^\n]*\n?)', re.M)
+
+
+def _missing_modules(ie):
+    """Sends a list of the non-standard libraries and exits when one of them isn't installed.  The libraries are
+    imported where they're first used, so ``--help`` and the prompts don't wait on them.
+
+    :param ImportError ie: The error from the failed import
+    :return: None
+    """
+    mod_list = ['jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader', 'from termcolor import cprint']
 
     print(ie)
     print('Please ensure the following modules are imported to the environment you are running python from before '
@@ -37,6 +65,47 @@ except ImportError as ie:
     exit()
 
 
+def _decode_config(raw):
+    """Decodes bytes taken from the mapped old configuration with the locale encoding, normalizing Windows line
+    endings.
+
+    :param bytes raw: A line or block of lines from the old configuration
+    :return: **str** The decoded configuration
+    :rtype: str
+    """
+    return raw.decode(_CONFIG_ENCODING).replace('\r\n', '\n')
+
+
+def _plain_print(text, *args, **kwargs):
+    """Stands in for ``termcolor.cprint`` when stdout isn't a terminal, the color arguments are ignored.
+
+    :param str text: The status message to print
+    :return: None
+    """
+    print(text)
+
+
+@cache
+def _jinja_env():
+    """Builds the Jinja2 environment on first use and shares it with every ``ConfigGenerator``, compiled templates are
+    cached across runs.  jinja2 is only imported once a template is needed.
+
+    :return: **jinja2.Environment** The environment for every render
+    :rtype: jinja2.Environment
+    """
+    try:
+        from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+    except ImportError as ie:
+        _missing_modules(ie)
+
+    # Templates are only written before they are first loaded, so there's no need to check them for changes.  New
+    # switch templates are loaded from where they're written, they don't need to be moved out of the project templates.
+    # The output is switch configuration, not HTML, so nothing is escaped.  The whitespace options are left at their
+    # defaults, the rendered configurations depend on the template line breaks
+    return Environment(loader=FileSystemLoader([str(_TEMPLATE_PATH), str(_NEW_TEMPLATE_PATH)]), auto_reload=False,
+                       autoescape=False, optimized=True, bytecode_cache=FileSystemBytecodeCache())
+
+
 class ConfigGenerator:
     """
     This class reads information from an old Cisco IOS or IOS-XE router or switch configuration and creates a new
@@ -46,25 +115,33 @@ class ConfigGenerator:
     Methods
     ========
     read_old_config()
-        Reads the old configuration file and extracts unique information for use in the new configuration.
+        Reads the old configuration file into ``self.old_config``.
+
+    get_switch_info()
+        Extracts unique information from the old configuration for use in the new configuration.
 
     read_templates_and_set_conditions()
         This method reads the base jinja2 template into the variable ``data`` and modifies it to set the dictionary
         conditions prior to the template rendering, as well as insert all the block configuration.
 
     create_new_config()
-        This method renders the new configuration template, outputs that to a new configuration file and then moves the
-        new configuration template to a new folder outside of the project templates folder.
+        This method renders the new configuration template from the New_Templates folder and outputs that to a new
+        configuration file.
 
     ===========
     Attributes
     ===========
     :var str self.current_date: Date for use in output file naming
-    :var str self.project_path: File path to the project
-    :var str self.template_path: File path to the templates for the project
+    :var pathlib.Path self.project_path: File path to the project, the folder this program is in
+    :var pathlib.Path self.template_path: File path to the templates for the project
+    :var pathlib.Path self.new_template_path: File path to the new switch templates, outside of the project templates
+    :var pathlib.Path self.old_config_dir: File path to the old configuration files
+    :var pathlib.Path self.new_config_dir: File path to store the new configuration files
+    :var pathlib.Path self.base_config_dir: File path to store the base configuration files rendered from CSV rows
     :var str self.old_config_file: Input from user, is the file name of the old configuration file
-    :var str self.old_config: Full file path and file name of the old configuration file
-    :var str self.new_config:  File path to store the new configuration file later
+    :var pathlib.Path self.old_config_path: Full file path and file name of the old configuration file
+    :var mmap.mmap self.old_config: Read only memory map of the old configuration file
+    :var pathlib.Path self.new_config: Full file path and file name of the new configuration file, set later
     :var str self.new_config_template: Empty string, will be used to store the new config template created later
     :var dict self.parameters_dict: Dictionary that will be used to compile the dictionaries generated from the
         information gathering
@@ -77,25 +154,39 @@ class ConfigGenerator:
     :var str self.ip_route: String to store block configuration for all configured static routes if they exist
     :var str self.logging: String to store block configuration for all logging statements
     :var str self.rp_address: String to store block configuration for all rp-address statements if they exist
+    :var dict self.vlan_dict: The VLAN database
+    :var dict self.source_interface_dict: The source interface for network services
+    :var dict self.mtu_dict: The system MTU if it's configured in the old configuration
+    :var dict self.gateway_dict: The default gateway if it's configured in the old configuration
+    :var dict self._config_handlers: The method that handles each block and command keyword from ``_CONFIG_RE``
+    :var list self._interfaces_parts: Lists with a matching ``self._router_config_parts``, ``self._ip_route_parts``,
+        ``self._logging_parts`` and ``self._rp_address_parts`` that gather the block configuration before it's joined
     :var list self.base_config_dict_list: List of dictionaries used to render new base configs from CSV rows.
+    :var function self.cprint: ``termcolor.cprint`` when writing to a terminal, otherwise ``_plain_print``
+    :var float self._ui_delay: Seconds to pause after status messages, zero unless ``--slow-ui`` is given
     """
 
-    def __init__(self):
+    def __init__(self, slow_ui=False):
         """
+        :param bool slow_ui: Pause after status messages so they can be read as they print
         """
 
         self.current_date = datetime.now().strftime('%Y_%m_%d')
-        self.project_path = r'Place_Holder for now'
-        self.template_path = os.path.join(self.project_path, r'Templates')
+        self.project_path = _PROJECT_PATH
+        self.template_path = _TEMPLATE_PATH
+        self.new_template_path = _NEW_TEMPLATE_PATH
+        self.old_config_dir = self.project_path / 'Configurations' / 'Old'
+        self.new_config_dir = self.project_path / 'Configurations' / 'New'
+        self.base_config_dir = self.project_path / 'Configurations' / 'Base_Configs'
         self.old_config_file = ''
+        self.old_config_path = ''
         self.old_config = ''
-        self.switch_template = os.path.join(self.template_path,  r'Switch_template.j2')
-        self.new_config = os.path.join(self.project_path, r'Configurations\New')  # Set the path for new config
+        self.switch_template = self.template_path / 'Switch_template.j2'
+        self.new_config = ''
         self.new_config_template = ''
         self.parameters_dict = {}
         self.template_conditions = {}
         self.switch_type_dict = {'$switch_type': ''}
-        self.site_prefix_dict = {'S1': 'site_1', 'S2': 'site_2', 'S3': 'Site_3'}
         self.site_dict = {'$site': ''}
         self.vlan_priority = ''
         self.interfaces = ''
@@ -103,31 +194,114 @@ class ConfigGenerator:
         self.ip_route = ''
         self.logging = ''
         self.rp_address = ''
+        self.vlan_dict = {'vlans': {}}
+        self.source_interface_dict = {'source_interface': ''}
+        self.mtu_dict = {'mtu': ''}
+        self.gateway_dict = {'gateway': ''}
+        # Handlers for the block and single line command keywords matched by _CONFIG_RE
+        self._config_handlers = {b'vlan ': self._get_vlan,
+                                 b'interface ': self._get_interface,
+                                 b'router ': self._get_router,
+                                 b'spanning-tree vlan': self._get_vlan_priority,
+                                 b'ip route': self._get_ip_route,
+                                 b'logging': self._get_logging,
+                                 b'ip tacacs source-interface': self._get_source_interface,
+                                 b'ip pim rp-address': self._get_rp_address,
+                                 b'system mtu': self._get_mtu,
+                                 b'ip default-gateway': self._get_gateway}
+        self._interfaces_parts = []
+        self._router_config_parts = []
+        self._ip_route_parts = []
+        self._logging_parts = []
+        self._rp_address_parts = []
         self.base_config_dict_list = []
+        # Colors are only worth formatting for a terminal, piped or logged output gets plain text
+        self._use_color = sys.stdout.isatty()
+        if self._use_color:
+            try:
+                from termcolor import cprint
+            except ImportError as ie:
+                _missing_modules(ie)
+            self.cprint = cprint
+        else:
+            self.cprint = _plain_print
+        self._ui_delay = .1 if slow_ui else 0.0  # The pauses are only for reading the output, skip them by default
+
+    @cached_property
+    def _edge_tmpl(self):
+        """:return: **jinja2.Template** The SDA edge node base config template, loaded on first use"""
+        return _jinja_env().get_template('SDA_edge_base_config_template.j2')
+
+    @cached_property
+    def _in_isis_tmpl(self):
+        """:return: **jinja2.Template** The intermediate node ISIS template for edge nodes, loaded on first use"""
+        return _jinja_env().get_template('in_isis_template.j2')
+
+    @cached_property
+    def _in_base_tmpl(self):
+        """:return: **jinja2.Template** The SDA intermediate node base config template, loaded on first use"""
+        return _jinja_env().get_template('SDA_in_base_config_template.j2')
+
+    @cached_property
+    def _bn_isis_tmpl(self):
+        """:return: **jinja2.Template** The border node ISIS template for intermediate nodes, loaded on first use"""
+        return _jinja_env().get_template('bn_isis_template.j2')
 
     def read_old_config(self):
-        """Reads the old configuration file and extracts unique information for use in the new configuration.
+        """Memory maps the old configuration file into ``self.old_config`` for parsing by ``get_switch_info()``.
+
+        :raise FileNotFoundError: If the filename is incorrect or file not being present in the correct folder.
+        :except PermissionError: If the file is open
+        :except ValueError: If the file is empty
+
+        :returns: **mmap.mmap** A read only map of the old switch configuration
+        :rtype: mmap.mmap
+
+        """
+        self.old_config_file = str(input('What is the filename of the old config file that you want to upgrade? '
+                                         '(Include the extension) '))
+        self.old_config_path = self.old_config_dir / self.old_config_file
+
+        while True:  # Only the open is retried while the file is locked, the filename is kept
+            try:
+                with open(self.old_config_path, 'rb') as old_config:
+                    # Map the file instead of copying it into a str, get_switch_info() decodes only what it keeps
+                    self.old_config = mmap.mmap(old_config.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):  # Not on Windows, read ahead for the front to back searches
+                    self.old_config.madvise(mmap.MADV_SEQUENTIAL)
+                break
+
+            except FileNotFoundError:
+                print(f'\n{self.old_config_path}', 'is not a valid file\nPlease check the filename and try again.\n')
+                exit()
+            except PermissionError:
+                input(f'Please close the following file.\n\n{self.old_config_path}\n\nPress any key to try again.')
+            except ValueError:  # mmap refuses zero length files
+                print(f'\n{self.old_config_path}', 'is empty\nPlease check the filename and try again.\n')
+                exit()
+
+    def get_switch_info(self):
+        """Extracts the unique information from ``self.old_config`` for use in the new configuration.
+
+        The hostname is found with ``_HOSTNAME_RE``, which stops at the one hostname line.  Everything else is found
+        in one pass of ``_CONFIG_RE``: block configurations (VLANs, interfaces and router instances) up to their
+        closing ``!`` and the lines of the single line commands.  Only the tokens and blocks that are kept are decoded
+        to ``str``.  The map is closed once the searches are finished.
 
         =========
         Variables
         =========
 
-        ``:var dict site_dict:`` The site parameter used for conditions in site specific template selection\n
+        ``:var re.Match hostname:`` The hostname line found by ``_HOSTNAME_RE``\n
+        ``:var re.Match config:`` A block or single line command found by ``_CONFIG_RE``, handed to its handler in
+        ``self._config_handlers``\n
         ``:var dict hostname_dict:`` The hostname of the switch\n
-        ``:var dict vlan_dict:`` The VLAN database\n
-        ``:var dict source_interface_dict:`` The source interface for network services\n
         ``:var dict location_dict:`` The building and room number for SNMP lookup\n
-        ``:var dict mtu_dict:`` The system MTU if it's configured in the old configuration\n
-        ``:var dict gateway_dict:`` The default gateway if it's configured in the old configuration\n
         ``:var dict ecn_dict:`` Input from the user for the new switch ECN number\n
         ``:var lst dict_list:`` The list of all the dictionaries to use to update the ``self.parameters_dict`` for ease
         of rendering the jinja2 template\n
         ``:var lst condition_dict_list:`` List of dictionary objects used to set the template conditions prior to
-        rendering\n
-        ``:var lst access_switch_prefix_list:`` Prefixes used to determine if the switch is access layer
-
-        :raise FileNotFoundError: If the filename is incorrect or file not being present in the correct folder.
-        :except PermissionError: If the file is open
+        rendering
 
         :returns: **[dict, list, str]** Several different data stores with dictionaries, lists and strings of configuration
         extracted from the old switch configuration
@@ -136,129 +310,173 @@ class ConfigGenerator:
         :rtype: str
 
         """
-        self.old_config_file = str(input('What is the filename of the old config file that you want to upgrade? '
-                                         '(Include the extension) '))
-        self.old_config = os.path.join(self.project_path, r'Configurations\Old', self.old_config_file)
         hostname_dict = {'hostname': ''}
-        vlan_dict = {'vlans': {}}
-        source_interface_dict = {'source_interface': ''}
         location_dict = {'building': '', 'room': ''}
-        mtu_dict = {'mtu': ''}
-        gateway_dict = {'gateway': ''}
         ecn_dict = {'chassis_id': input('What is the ECN of the replacement switch? ')}
         # Turn into instance variable and remove dictionary names, append dictionaries to the list from each method
-        dict_list = [hostname_dict, vlan_dict, source_interface_dict, location_dict, ecn_dict]  
+        dict_list = [hostname_dict, self.vlan_dict, self.source_interface_dict, location_dict, ecn_dict]
         condition_dict_list = [self.site_dict, self.switch_type_dict]
-        access_switch_prefix_list = ['AS', 'SE', 'EN']
 
-        cprint('\nReading Old Configuration ...\n', 'blue', attrs=['bold'], force_color=True)
-        time.sleep(.2)
-        # TODO: Open the file and save to variable for iteration in it's own method
-        try:
-            with (open(self.old_config, 'r') as old_config):
-                for line in old_config:
-                    if line.startswith('hostname'):
-                        cprint('Getting the hostname ...\n', 'light_cyan', force_color=True)
-                        time.sleep(.1)
-                        hostname_list = line.split(' ')  # Create a new list split on blank spaces
-                        hostname_dict['hostname'] = hostname_list[1].replace('\n', '').upper()
-                        site_prefix = hostname_dict['hostname'][:2]  # Get the prefix from the hostname
-                        if site_prefix.upper() in self.site_prefix_dict:
-                            cprint('Getting the site from the hostname ...\n', 'light_cyan', force_color=True)
-                            self.site_dict['$site'] = self.site_prefix_dict[site_prefix.upper()]  # Use prefix as site variable
-                            cprint('This switch will be configured for the ' + self.site_dict['$site'] + ' site!!\n',
-                                   'red', attrs=['bold'], force_color=True)
-                            time.sleep(.1)
-                        cprint('Setting the location from the hostname ...\n', 'light_cyan', force_color=True)
-                        time.sleep(.1)
-                        location_list = hostname_dict['hostname'].split('-')  # Split the hostname to get location
-                        location_dict['building'] = location_list[2]  # Set building number from hostname
-                        location_dict['room'] = location_list[3]  # Set room number from hostname
-                        switch_type_prefix = location_list[1]
-                        if switch_type_prefix.upper() in access_switch_prefix_list:  # Set switch type from the prefix
-                            self.switch_type_dict['$switch_type'] = 'access'
-                        else:
-                            self.switch_type_dict['$switch_type'] = 'router'
-                    # TODO: Split here for VLAN Method
-                    elif line.startswith('spanning-tree vlan'):  # Get spanning-tree vlan priorities if they exist
-                        self.vlan_priority = line
-                    elif line.startswith('vlan'):  # Get VLAN database information
-                        vlan_list = line.split(' ')
-                        vlan_id = vlan_list[1].replace('\n', '')
-                        vlan_dict['vlans'].setdefault(vlan_id, {})
-                        for vlan in old_config:
-                            if vlan.startswith(' name'):
-                                vlan_name_list = vlan.split(' ')
-                                vlan_dict['vlans'][vlan_id]['name'] = vlan_name_list[-1].replace('\n', '')
-                            elif vlan.startswith('!'):
-                                break
-                    # TODO: Split here for interface method
-                    elif line.startswith('interface'):  # Copy the interface configurations
-                        interfaces = ''
-                        interfaces += line  # First Line is the interface name
-                        for interface in old_config:
-                            if '!' in interface:  # Stop copying lines at the !
-                                interfaces += '!\n'
-                                break
-                            else:
-                                interfaces += interface
-
-                        # Set the standard SVI configurations if they don't exist
-                        if 'interface Vlan' in interfaces and ' no ip proxy-arp' not in interfaces:
-                            interfaces = interfaces.replace('!\n', ' no ip proxy-arp\n no ip redirects\n!\n')
-                            # TODO: Add elif for access ports to add standard config and remove duplicates
-                            # TODO: Add elif for trunk interfaces to remove native vlans
-                        self.interfaces += interfaces
-                    # TODO: Split here for router configuration method
-                    elif line.startswith('router '):  # Copy all router instances as a block config
-                        self.router_config += line
-                        for router_config in old_config:
-                            if '!' in router_config:
-                                self.router_config += '!'
-                                break
-                            else:
-                                self.router_config += router_config
-                    elif line.startswith('ip route'):  # Copy all static routes as a block config
-                        self.ip_route += line
-                    # TODO: Split here for remaining services method
-                    elif line.startswith('logging'):  # Copy the logging information as a block config
-                        if 'buffered' in line:  # Skip buffered logging config, this will be set by a new standard
-                            continue
-                        else:
-                            self.logging += line
-
-                    # Gather the source interface from the 'tacacs source-interface' command
-                    elif line.startswith('ip tacacs source-interface'):
-                        source_list = line.split(' ')
-                        if source_list[-1] == '\n':
-                            del source_list[-1]
-                        source_interface_dict['source_interface'] = source_list[-1]
-                    elif line.startswith('ip pim rp-address'):  # Copy the rp-address for pim
-                        self.rp_address += line
-                    elif line.startswith('system mtu'):  # Copy the system MTU if it exists
-                        mtu_list = line.split(' ')
-                        mtu_dict['mtu'] = mtu_list[-1]
-                        dict_list.append(mtu_dict)
-                    elif line.startswith('ip default-gateway'):  # Copy the default gateway if it exists
-                        default_list = line.split(' ')
-                        gateway_dict['gateway'] = default_list[-1]
-                        dict_list.append(gateway_dict)
-            for dictionary in dict_list:  # Update the parameters_dict with all the gathered dictionaries
-                self.parameters_dict.update(dictionary)
-            for dictionary in condition_dict_list:  # Update the template_conditions dictionary
-                self.template_conditions.update(dictionary)
-            self.new_config_template = hostname_dict['hostname'] + '.j2'  # Set the new template name from hostname
-            new_config_file = hostname_dict['hostname'] + '_' + self.current_date + '.cfg'
-            self.new_config = os.path.join(self.new_config, new_config_file)  # Set the new config file from hostname
-            # for key, value in self.parameters_dict.items():
-            #     print(f"{key}: {value}")
+        self.cprint('\nReading Old Configuration ...\n', 'blue', attrs=['bold'], force_color=True)
+        if self._ui_delay:
+            time.sleep(2 * self._ui_delay)
+        with self.old_config:  # The map is released as soon as the searches are done, even if one of them fails
+            hostname = _HOSTNAME_RE.search(self.old_config)  # Stops at the first match near the top of the file
+            if hostname:
+                hostname_dict['hostname'] = hostname.group(1).decode(_CONFIG_ENCODING).upper()
+
+            # Only the blocks and lines that are kept come back from the regex engine, the rest are never touched
+            for config in _CONFIG_RE.finditer(self.old_config):
+                self._config_handlers[config[config.lastindex]](config[0])  # Keyed on the matched keyword group
+
+        if self.mtu_dict['mtu']:  # The MTU and gateway are only rendered if they're in the old configuration
+            dict_list.append(self.mtu_dict)
+        if self.gateway_dict['gateway']:
+            dict_list.append(self.gateway_dict)
+
+        # Join the gathered block configuration once the whole configuration has been read
+        self.interfaces = ''.join(self._interfaces_parts)
+        self.router_config = ''.join(self._router_config_parts)
+        self.ip_route = ''.join(self._ip_route_parts)
+        self.logging = ''.join(self._logging_parts)
+        self.rp_address = ''.join(self._rp_address_parts)
+        # One summary of what was kept instead of a message per block, every interface ends with its own ! part.  Global
+        # vlan commands like ``vlan internal allocation policy`` are in the VLAN database too, only numbered ids count
+        vlan_count = sum(vlan_id[:1].isdigit() for vlan_id in self.vlan_dict['vlans'])
+        interface_count = self._interfaces_parts.count('!\n')
+        self.cprint(f"Parsed {vlan_count} VLANs, {interface_count} interfaces, "
+                    f"{len(self._ip_route_parts)} static routes\n", 'light_cyan', force_color=True)
+
+        # The hostname is only parsed once, so the site and location are set from it after the line walk
+        if hostname_dict['hostname']:
+            self.cprint('Getting the hostname ...\n', 'light_cyan', force_color=True)
+            if self._ui_delay:
+                time.sleep(self._ui_delay)
+            site_prefix = hostname_dict['hostname'][:2]  # Get the prefix from the already upper case hostname
+            if site_prefix in _SITE_PREFIXES:
+                self.cprint('Getting the site from the hostname ...\n', 'light_cyan', force_color=True)
+                self.site_dict['$site'] = _SITE_PREFIXES[site_prefix]  # Use prefix as site variable
+                self.cprint('This switch will be configured for the ' + self.site_dict['$site'] + ' site!!\n',
+                            'red', attrs=['bold'], force_color=True)
+                if self._ui_delay:
+                    time.sleep(self._ui_delay)
+            self.cprint('Setting the location from the hostname ...\n', 'light_cyan', force_color=True)
+            if self._ui_delay:
+                time.sleep(self._ui_delay)
+            location_list = hostname_dict['hostname'].split('-', 4)  # Split the hostname to get location
+            location_dict['building'] = location_list[2]  # Set building number from hostname
+            location_dict['room'] = location_list[3]  # Set room number from hostname
+            switch_type_prefix = location_list[1]
+            if switch_type_prefix in _ACCESS_PREFIXES:  # Set switch type from the prefix
+                self.switch_type_dict['$switch_type'] = 'access'
+            else:
+                self.switch_type_dict['$switch_type'] = 'router'
+
+        for dictionary in dict_list:  # Update the parameters_dict with all the gathered dictionaries
+            self.parameters_dict.update(dictionary)
+        for dictionary in condition_dict_list:  # Update the template_conditions dictionary
+            self.template_conditions.update(dictionary)
+        self.new_config_template = hostname_dict['hostname'] + '.j2'  # Set the new template name from hostname
+        new_config_file = hostname_dict['hostname'] + '_' + self.current_date + '.cfg'
+        self.new_config = self.new_config_dir / new_config_file  # Set the new config file from hostname
+        # for key, value in self.parameters_dict.items():
+        #     print(f"{key}: {value}")
+
+    def _get_vlan(self, block):
+        """Gets the VLAN database information from a VLAN block.
+
+        :param bytes block: A ``vlan`` block from the old configuration, without its closing ``!``
+        :return: None
+        """
+        # Only the first argument is the VLAN id, ``vlan internal allocation policy ascending`` is kept as ``internal``
+        header = block.partition(b'\n')[0].split(None, 2)
+        vlan_id = header[1].decode(_CONFIG_ENCODING) if len(header) > 1 else ''
+        self.vlan_dict['vlans'].setdefault(vlan_id, {})
+        for vlan in block.splitlines():
+            if vlan.startswith(b' name'):
+                self.vlan_dict['vlans'][vlan_id]['name'] = vlan.rstrip().rpartition(b' ')[2].decode(_CONFIG_ENCODING)
+
+    def _get_interface(self, block):
+        """Copies an interface configuration to the interface block config.
+
+        :param bytes block: An ``interface`` block from the old configuration, without its closing ``!``
+        :return: None
+        """
+        interfaces = _decode_config(block)
+        self._interfaces_parts.append(interfaces)  # The standard lines and closing ! are appended as their own parts
 
-        except FileNotFoundError:
-            print('\n' + self.old_config, 'is not a valid file\nPlease check the filename and try again.\n')
-            exit()
-        except PermissionError:
-            input('Please close the following file.\n\n' + self.old_config + '\n\nPress any key to try again.')
-            self.read_old_config()
+        # Set the standard SVI configurations if they don't exist
+        if 'interface Vlan' in interfaces and ' no ip proxy-arp' not in interfaces:
+            self._interfaces_parts.append(' no ip proxy-arp\n no ip redirects\n')
+            # TODO: Add elif for access ports to add standard config and remove duplicates
+            # TODO: Add elif for trunk interfaces to remove native vlans
+        self._interfaces_parts.append('!\n')
+
+    def _get_router(self, block):
+        """Copies a router instance to the router block config.
+
+        :param bytes block: A ``router`` block from the old configuration, without its closing ``!``
+        :return: None
+        """
+        self._router_config_parts.append(_decode_config(block))
+        self._router_config_parts.append('!')
+
+    def _get_vlan_priority(self, line):
+        """Gets the spanning-tree vlan priorities if they exist.
+
+        :param bytes line: The ``spanning-tree vlan`` line from the old configuration
+        :return: None
+        """
+        self.vlan_priority = _decode_config(line)
+
+    def _get_ip_route(self, line):
+        """Copies a static route to the static route block config.
+
+        :param bytes line: An ``ip route`` line from the old configuration
+        :return: None
+        """
+        self._ip_route_parts.append(_decode_config(line))
+
+    def _get_logging(self, line):
+        """Copies the logging information to the logging block config.
+
+        :param bytes line: A ``logging`` line from the old configuration
+        :return: None
+        """
+        if b'buffered' not in line:  # Skip buffered logging config, this will be set by a new standard
+            self._logging_parts.append(_decode_config(line))
+
+    def _get_source_interface(self, line):
+        """Gathers the source interface from the 'tacacs source-interface' command.
+
+        :param bytes line: The ``ip tacacs source-interface`` line from the old configuration
+        :return: None
+        """
+        self.source_interface_dict['source_interface'] = line.rstrip().rpartition(b' ')[2].decode(_CONFIG_ENCODING)
+
+    def _get_rp_address(self, line):
+        """Copies the rp-address for pim to the rp-address block config.
+
+        :param bytes line: An ``ip pim rp-address`` line from the old configuration
+        :return: None
+        """
+        self._rp_address_parts.append(_decode_config(line))
+
+    def _get_mtu(self, line):
+        """Copies the system MTU if it exists.
+
+        :param bytes line: The ``system mtu`` line from the old configuration
+        :return: None
+        """
+        self.mtu_dict['mtu'] = line.rstrip().rpartition(b' ')[2].decode(_CONFIG_ENCODING)
+
+    def _get_gateway(self, line):
+        """Copies the default gateway if it exists.
+
+        :param bytes line: The ``ip default-gateway`` line from the old configuration
+        :return: None
+        """
+        self.gateway_dict['gateway'] = line.rstrip().rpartition(b' ')[2].decode(_CONFIG_ENCODING)
 
     def read_templates_and_set_conditions(self):
         """This method reads the base jinja2 template into the variable ``data`` and modifies it to set the dictionary
@@ -267,63 +485,62 @@ class ConfigGenerator:
         =========
         Variables
         =========
-        ``:var str data:`` The string object from the base switch template
+        ``:var str data:`` The string object from the base switch template\n
+        ``:var dict substitutions:`` The template conditions and block configuration markers with their replacements\n
+        ``:var re.Pattern substitution_re:`` Alternation of every key in ``substitutions``, longest first, so
+        ``data`` is only scanned once
 
         :return: **str** A new template names with the hostname from the switch
         :rtype: str
 
         """
 
-        cprint('Copying Master Template and Setting Template Conditions ...\n', 'blue',
-               attrs=['bold'], force_color=True)
-        time.sleep(.1)
-        new_config_template = os.path.join(self.template_path, self.new_config_template)
+        self.cprint('Copying Master Template and Setting Template Conditions ...\n', 'blue',
+                    attrs=['bold'], force_color=True)
+        if self._ui_delay:
+            time.sleep(self._ui_delay)
+        new_config_template = self.new_template_path / self.new_config_template
 
         # read in Switch_Template.j2 template to write to new template hostname.j2
         with open(self.switch_template, 'r') as master_template, open(new_config_template, 'w') as config_template:
             data = master_template.read()
-            for key in self.template_conditions:  # Add the conditions to set the site and switch type
-                data = data.replace(key, self.template_conditions[key])
-            # Replace variables in the template with block configuration from the old config
-            data = data.replace('!!!vlan_priority', self.vlan_priority)
-            data = data.replace('!!!Interfaces', self.interfaces)
-            data = data.replace('!!!router_config', self.router_config)
-            data = data.replace('!!!rp-address', self.rp_address)
-            data = data.replace('!!!ip_route', self.ip_route)
-            data = data.replace('!!!logging', self.logging)
-            config_template.write(data)
+            # Conditions set the site and switch type, the !!! markers take the block configuration from the old config
+            substitutions = {**self.template_conditions,
+                             '!!!vlan_priority': self.vlan_priority,
+                             '!!!Interfaces': self.interfaces,
+                             '!!!router_config': self.router_config,
+                             '!!!rp-address': self.rp_address,
+                             '!!!ip_route': self.ip_route,
+                             '!!!logging': self.logging}
+            # Longest keys first, so a key that starts with a shorter key isn't cut off by the shorter match
+            substitution_re = re.compile('|'.join(map(re.escape, sorted(substitutions, key=len, reverse=True))))
+            # Single pass over data, written straight to the new template
+            config_template.write(substitution_re.sub(lambda match: substitutions[match.group(0)], data))
 
     def create_new_config(self):
-        """This method renders the new configuration template, outputs that to a new configuration file and then moves the
-        new configuration template to a new folder outside of the project templates folder.
-
-        ``:var str source_file:`` New configuration template in the original location\n
-        ``:var str destination_file:`` New configuration template in the new location outside the project templates
-        folder\n
+        """This method renders the new configuration template from the New_Templates folder, where
+        ``read_templates_and_set_conditions()`` wrote it, and outputs that to a new configuration file.
 
         :return: **str** New configuration file
         :rtype: str
         """
-        cprint('Rendering Templates ....\n', 'blue', attrs=['bold'], force_color=True)
-        time.sleep(.1)
-        env = Environment(loader=FileSystemLoader(self.template_path))
+        self.cprint('Rendering Templates ....\n', 'blue', attrs=['bold'], force_color=True)
+        if self._ui_delay:
+            time.sleep(self._ui_delay)
 
         # render hostname.j2 template
-        switch_config_template = env.get_template(self.new_config_template)
-        switch_config = switch_config_template.render(self.parameters_dict)
+        switch_config_template = _jinja_env().get_template(self.new_config_template)
         with open(self.new_config, 'w') as new_config:
-            new_config.write(switch_config)
-        source_file = os.path.join(self.template_path, self.new_config_template)
-        destination_file = os.path.join(self.template_path, 'New_Templates', self.new_config_template)
-        if os.path.exists(destination_file):
-            os.remove(destination_file)
-
-        os.rename(source_file, destination_file)
+            # Stream the rendered fragments to the file instead of holding the whole configuration in memory, the
+            # fragments are joined in small groups so the file isn't written one short string at a time
+            switch_config_stream = switch_config_template.stream(self.parameters_dict)
+            switch_config_stream.enable_buffering(size=5)
+            switch_config_stream.dump(new_config)
 
-        cprint(f"Configuration file {self.new_config} is created!\n", 'green',
-               attrs=['bold'], force_color=True)
-        cprint(f"The template file {self.new_config_template} has been moved to {destination_file}!\n",
-               'green', attrs=['bold'], force_color=True)
+        self.cprint(f"Configuration file {self.new_config} is created!\n", 'green',
+                    attrs=['bold'], force_color=True)
+        self.cprint(f"The template file {self.new_config_template} is saved in {self.new_template_path}!\n",
+                    'green', attrs=['bold'], force_color=True)
 
     def read_base_csv(self):
         """
@@ -331,16 +548,17 @@ class ConfigGenerator:
         :return:
         """
         base_csv = input('What is the name of your base CSV file? ')
-        full_csv_path = os.path.join(self.project_path, r'CSV_Files', base_csv)
-        cprint('Reading Base Config CSV File ....\n', 'blue', attrs=['bold'], force_color=True)
-        time.sleep(.1)
+        full_csv_path = self.project_path / 'CSV_Files' / base_csv
+        self.cprint('Reading Base Config CSV File ....\n', 'blue', attrs=['bold'], force_color=True)
+        if self._ui_delay:
+            time.sleep(self._ui_delay)
 
         try:
             try:
-                with open(full_csv_path, 'r', encoding='utf-8') as csv_file:
-                    reader = csv.DictReader(csv_file)
-                    for row in reader:
-                        self.base_config_dict_list.append(row)
+                with open(full_csv_path, 'r', encoding='utf-8', newline='') as csv_file:
+                    reader = csv.reader(csv_file)
+                    headers = next(reader, [])  # The header row is read once and zipped onto every row
+                    self.base_config_dict_list.extend(dict(zip(headers, row)) for row in reader if row)
             except UnicodeDecodeError:  # this does not catch txt files
                 print("Input file is not a csv file. Please enter a valid csv file.")
                 input("Press Enter to continue...")
@@ -351,34 +569,50 @@ class ConfigGenerator:
             exit()
 
     def write_qip_hostnames(self):
-        site_prefix = self.base_config_dict_list[0]['edge_hostname'][:2]  # Get the prefix from the hostname
-
-        if site_prefix.upper() in self.site_prefix_dict:
-            cprint('Getting the site from the hostname ...\n', 'light_cyan', force_color=True)
-            self.site_dict['$site'] = self.site_prefix_dict[site_prefix.upper()]  # Use prefix as site variable
-            cprint('These configurations will be configured for the ' + self.site_dict['$site'] + ' site!!\n',
-                   'red', attrs=['bold'], force_color=True)
-            time.sleep(.1)
-            hostname_file = os.path.join(self.project_path, r'Hostnames', self.site_dict['$site'] + '_hostnames.txt')
+        site_prefix = self.base_config_dict_list[0]['edge_hostname'][:2].upper()  # Get the prefix from the hostname
+
+        if site_prefix in _SITE_PREFIXES:
+            self.cprint('Getting the site from the hostname ...\n', 'light_cyan', force_color=True)
+            self.site_dict['$site'] = _SITE_PREFIXES[site_prefix]  # Use prefix as site variable
+            self.cprint('These configurations will be configured for the ' + self.site_dict['$site'] + ' site!!\n',
+                        'red', attrs=['bold'], force_color=True)
+            if self._ui_delay:
+                time.sleep(self._ui_delay)
+            hostname_file = self.project_path / 'Hostnames' / (self.site_dict['$site'] + '_hostnames.txt')
+
+            chunks = []  # One block of hostname lines per row, written to the file all at once
+            for row in self.base_config_dict_list:
+                edge_hostname = row['edge_hostname'].upper()  # Upper case each hostname once per row
+                in_hostname = row['in_hostname'].upper()
+                chunks.append(f"{_SEP}\n"
+                              f"{row['edge_interface_addr1']}\t-\tP2P-{edge_hostname}-to-{in_hostname}-1\n"
+                              f"{row['edge_interface_addr2']}\t-\tP2P-{edge_hostname}-to-{in_hostname}-2\n"
+                              f"{row['in_interface_addr1']}\t-\tP2P-{in_hostname}-to-{edge_hostname}-1\n"
+                              f"{row['in_interface_addr2']}\t-\tP2P-{in_hostname}-to-{edge_hostname}-2\n\n")
 
             with open(hostname_file, 'w') as h_file:
-                for row in self.base_config_dict_list:
-                    h_file.write('*' * 79 + '\n')
-                    h_file.write(
-                        row['edge_interface_addr1'] + '\t-\tP2P-' + row['edge_hostname'].upper() + '-to-' +
-                        row['in_hostname'].upper() + '-1\n')
-                    h_file.write(
-                        row['edge_interface_addr2'] + '\t-\tP2P-' + row['edge_hostname'].upper() + '-to-' +
-                        row['in_hostname'].upper() + '-2\n')
-                    h_file.write(
-                        row['in_interface_addr1'] + '\t-\tP2P-' + row['in_hostname'].upper() + '-to-' +
-                        row['edge_hostname'].upper() + '-1\n')
-                    h_file.write(
-                        row['in_interface_addr2'] + '\t-\tP2P-' + row['in_hostname'].upper() + '-to-' +
-                        row['edge_hostname'].upper() + '-2\n\n')
-
-            cprint(f"hostname file {hostname_file} has been created!\n", 'green',
-                   attrs=['bold'], force_color=True)
+                h_file.write(''.join(chunks))
+
+            self.cprint(f"hostname file {hostname_file} has been created!\n", 'green',
+                        attrs=['bold'], force_color=True)
+
+    def _write_base_configs(self, new_files, append_files):
+        """Writes the rendered base configurations with one open and one write per file.
+
+        :param dict new_files: The rendered configuration for each file path that's created or overwritten
+        :param dict append_files: The list of rendered configurations to append to each file path
+        :return: None
+        """
+        for file_path, config in new_files.items():
+            with open(file_path, 'w') as config_file:
+                config_file.write(config)
+            self.cprint(f"Configuration file {file_path} has been created!\n", 'green',
+                        attrs=['bold'], force_color=True)
+        for file_path, configs in append_files.items():
+            with open(file_path, 'a') as config_file:
+                config_file.write(''.join(configs))
+            self.cprint(f"Configuration file {file_path} has been created!\n", 'green',
+                        attrs=['bold'], force_color=True)
 
     def create_edge_base_config(self):
         """
@@ -391,32 +625,24 @@ class ConfigGenerator:
             print('That is not a valid configuration type.  Please select either "new" or "replacement".')
             create_edge_base_config()
 
-        cprint('Rendering Edge Node Base Config Template ....\n', 'blue', attrs=['bold'], force_color=True)
-        time.sleep(.1)
-        env = Environment(loader=FileSystemLoader(self.template_path))
-        edge_base_config_template = 'SDA_edge_base_config_template.j2'
-        in_isis_template = 'in_isis_template.j2'
-        edge_template = env.get_template(edge_base_config_template)
-        in_template = env.get_template(in_isis_template)
+        self.cprint('Rendering Edge Node Base Config Template ....\n', 'blue', attrs=['bold'], force_color=True)
+        if self._ui_delay:
+            time.sleep(self._ui_delay)
+        # Both templates are compiled once per instance and only executed per row
+        edge_template = self._edge_tmpl
+        in_template = self._in_isis_tmpl
+        new_files = {}  # Base configs are rewritten, the last row for a hostname wins
+        append_files = defaultdict(list)  # ISIS configs gather every row for a hostname
         try:
             for row in self.base_config_dict_list:
-                edge_base_config = os.path.join(self.project_path, r'Configurations\Base_Configs',
-                                                row['edge_hostname'] + '_base.txt')
-                in_isis_config = os.path.join(self.project_path, r'Configurations\Base_Configs',
-                                              row['in_hostname'] + '_isis.txt')
+                edge_base_config = self.base_config_dir / f"{row['edge_hostname']}_base.txt"
+                in_isis_config = self.base_config_dir / f"{row['in_hostname']}_isis.txt"
                 row['in_interface_description'] = (row['in_hostname'].upper() +
                                                    ' To ' + row['edge_hostname'].upper() + ' - Fabric Underlay')
+                new_files[edge_base_config] = edge_template.render(row)
                 if base_config_type.lower() == 'new':
-                    isis_config = in_template.render(row)
-                base_config = edge_template.render(row)
-                with open(edge_base_config, 'w') as edge_config, open(in_isis_config, 'a') as in_config:
-                    edge_config.write(base_config)
-                    in_config.write(isis_config)
-
-                cprint(f"Configuration file {edge_base_config} has been created!\n", 'green',
-                       attrs=['bold'], force_color=True)
-                cprint(f"Configuration file {in_isis_config} has been created!\n", 'green',
-                       attrs=['bold'], force_color=True)
+                    append_files[in_isis_config].append(in_template.render(row))
+            self._write_base_configs(new_files, append_files)
 
         except FileNotFoundError:
             with open(in_isis_config, 'w') as in_config:
@@ -428,51 +654,42 @@ class ConfigGenerator:
 
         :return:
         """
-        cprint('Rendering Intermediate Node Base Config Template ....\n', 'blue', attrs=['bold'], force_color=True)
-        time.sleep(.1)
-        env = Environment(loader=FileSystemLoader(self.template_path))
-        in_base_config_template = 'SDA_in_base_config_template.j2'
-        bn_isis_template = 'bn_isis_template.j2'
-        in_template = env.get_template(in_base_config_template)
-        bn_template = env.get_template(bn_isis_template)
+        self.cprint('Rendering Intermediate Node Base Config Template ....\n', 'blue', attrs=['bold'], force_color=True)
+        if self._ui_delay:
+            time.sleep(self._ui_delay)
+        # Both templates are compiled once per instance and only executed per row
+        in_template = self._in_base_tmpl
+        bn_template = self._bn_isis_tmpl
+        new_files = {}  # Base configs are rewritten, the last row for a hostname wins
+        append_files = defaultdict(list)  # ISIS configs gather every row for a hostname
+        rows = self.base_config_dict_list
+        # The short names for the descriptions are built a column at a time, the row loop only looks them up.  Only the
+        # second and third fields and the last field are used, so the splits stop after the third field
+        in_names = ["-".join([*row['in_hostname'].split('-', 3)[1:3], row['in_hostname'].rpartition('-')[2]]).upper()
+                    for row in rows]
+        bn1_names = ["-".join(row['bn1_hostname'].split('-', 3)[1:3]).upper() for row in rows]
+        bn2_names = ["-".join(row['bn2_hostname'].split('-', 3)[1:3]).upper() for row in rows]
         try:
-            for row in self.base_config_dict_list:
-                in_base_config = os.path.join(self.project_path, r'Configurations\Base_Configs',
-                                              row['in_hostname'] + '_base.txt')
-                bn1_isis_config = os.path.join(self.project_path, r'Configurations\Base_Configs',
-                                               row['bn1_hostname'] + '_isis.txt')
-                bn2_isis_config = os.path.join(self.project_path, r'Configurations\Base_Configs',
-                                               row['bn2_hostname'] + '_isis.txt')
-                in_name_list = row['in_hostname'].split('-')
-                bn1_name_list = row['bn1_hostname'].split('-')
-                bn2_name_list = row['bn2_hostname'].split('-')
-                in_name = "-".join([in_name_list[1], in_name_list[2], in_name_list[-1]]).upper()
-                bn1_name = "-".join(bn1_name_list[1:3]).upper()
-                bn2_name = "-".join(bn2_name_list[1:3]).upper()
-                row['in_interface1_description'] = in_name + '_TO_' + bn1_name + ' - Fabric Underlay'
-                row['in_interface2_description'] = in_name + '_TO_' + bn2_name + ' - Fabric Underlay'
-                row['bn1_interface_description'] = in_name + '_TO_' + bn1_name + ' - Fabric Underlay'
-                row['bn2_interface_description'] = in_name + '_TO_' + bn2_name + ' - Fabric Underlay'
-                bn1_title = '*' * 79 + '\n' + row['bn1_hostname'].center(79) + '\n' + '*' * 79
-                bn2_title = '*' * 79 + '\n' + row['bn2_hostname'].center(79) + '\n' + '*' * 79
-
-                base_config = in_template.render(row)
-                bn_config = bn_template.render(row)
+            for row, in_name, bn1_name, bn2_name in zip(rows, in_names, bn1_names, bn2_names):
+                in_base_config = self.base_config_dir / f"{row['in_hostname']}_base.txt"
+                bn1_isis_config = self.base_config_dir / f"{row['bn1_hostname']}_isis.txt"
+                bn2_isis_config = self.base_config_dir / f"{row['bn2_hostname']}_isis.txt"
+                # Each link has the same description on both ends, so it's built once and used twice
+                bn1_description = in_name + '_TO_' + bn1_name + ' - Fabric Underlay'
+                bn2_description = in_name + '_TO_' + bn2_name + ' - Fabric Underlay'
+                row['in_interface1_description'] = bn1_description
+                row['in_interface2_description'] = bn2_description
+                row['bn1_interface_description'] = bn1_description
+                row['bn2_interface_description'] = bn2_description
+                bn1_title = f"{_SEP}\n{row['bn1_hostname'].center(79)}\n{_SEP}"
+                bn2_title = f"{_SEP}\n{row['bn2_hostname'].center(79)}\n{_SEP}"
+
+                new_files[in_base_config] = in_template.render(row)
+                bn_config = bn_template.render(row)  # Split in half between the border nodes
                 half = len(bn_config) // 2
-                with (open(in_base_config, 'w') as in_config, open(bn1_isis_config, 'a') as bn1_config,
-                      open(bn2_isis_config, 'a') as bn2_config):
-                    in_config.write(base_config)
-                    bn1_config.write(bn1_title)
-                    bn1_config.write(bn_config[:half])
-                    bn2_config.write(bn2_title)
-                    bn2_config.write(bn_config[half:])
-
-                cprint(f"Configuration file {in_base_config} has been created!\n", 'green',
-                       attrs=['bold'], force_color=True)
-                cprint(f"Configuration file {bn1_isis_config} has been created!\n", 'green',
-                       attrs=['bold'], force_color=True)
-                cprint(f"Configuration file {bn2_isis_config} has been created!\n", 'green',
-                       attrs=['bold'], force_color=True)
+                append_files[bn1_isis_config].extend((bn1_title, bn_config[:half]))
+                append_files[bn2_isis_config].extend((bn2_title, bn_config[half:]))
+            self._write_base_configs(new_files, append_files)
         except FileNotFoundError:
             with open(in_isis_config, 'w') as in_config:
                 print(in_config, 'Not found.  Creating a new file. \n')
@@ -487,13 +704,14 @@ def sub_main(args):
     :return: None
     """
 
-    cfg = ConfigGenerator()
+    cfg = ConfigGenerator(args.slow_ui)
 
     while True:
         config_type = input('What configuration do you want to perform? (Type "List" for options.) ')
         config_list = ['whole', 'edge_base', 'in_base']
         if config_type.lower() == 'whole':
             cfg.read_old_config()
+            cfg.get_switch_info()
             cfg.read_templates_and_set_conditions()
             cfg.create_new_config()
             break
@@ -529,6 +747,7 @@ def main():
     # Create CLI arguments and descriptions
     parser = argparse.ArgumentParser(description='This program creates new configurations from old configuration files '
                                                  'for Cisco switches')
+    parser.add_argument('--slow-ui', action='store_true', help='Pause after status messages so they can be read')
     args = parser.parse_args()
     sub_main(args)
 